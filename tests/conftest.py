@@ -1,6 +1,7 @@
 import itertools as it
+import sys
 from collections import abc
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 from pathlib import Path
 from typing import (
     Any,
@@ -112,20 +113,65 @@ def assert_equal_arrays(
     else:
         assert a.ndim == b.ndim
         assert a.shape == b.shape
-    np.testing.assert_array_equal(a, b)
-
-
-def iter_slices(i: int, j: int) -> Iterable[slice]:
+    if not np.array_equal(a, b):
+        # only build the detailed mismatch report on failure
+        np.testing.assert_array_equal(a, b)
+
+
+def collect(arrays: Iterable[np.ndarray]) -> np.ndarray:
+    """
+    Equivalent to `segyio.tools.collect` without its list-then-stack double copy.
+
+    segyio generators reuse their output buffers, so every array is copied directly
+    into a preallocated result before the generator is advanced. The result doubles
+    in size when full, so previously collected arrays may be copied again.
+    """
+    buf: Optional[np.ndarray] = None
+    size = 0
+    for array in arrays:
+        if buf is None:
+            buf = np.empty((16, *array.shape), array.dtype)
+        elif size == len(buf):
+            buf = np.concatenate((buf, np.empty_like(buf)))
+        buf[size] = array
+        size += 1
+    if buf is None:
+        raise ValueError("need at least one array to collect")
+    return buf[:size]
+
+
+def iter_slices(i: int, j: int) -> Tuple[slice, ...]:
     assert 0 <= i < j
-    slice_args = it.chain(
+    slices: Tuple[slice, ...] = (
         # non-negative start stop step
-        it.product((None, i), (None, j), (None, 2)),
-        # non-negative start stop, negative step
-        it.product((None, j - 1), (None, i - 1) if i > 0 else (None,), (-1, -2)),
+        slice(None, None),
+        slice(None, None, 2),
+        slice(None, j),
+        slice(None, j, 2),
+        slice(i, None),
+        slice(i, None, 2),
+        slice(i, j),
+        slice(i, j, 2),
+        # non-negative start, negative step
+        slice(None, None, -1),
+        slice(None, None, -2),
+        slice(j - 1, None, -1),
+        slice(j - 1, None, -2),
         # negative start and/or stop
-        [(-1, None, None), (None, -1, None), (-2, -1, None), (-1, -2, -1)],
+        slice(-1, None),
+        slice(None, -1),
+        slice(-2, -1),
+        slice(-1, -2, -1),
     )
-    return it.starmap(slice, slice_args)
+    if i > 0:
+        # non-negative start stop, negative step
+        slices += (
+            slice(None, i - 1, -1),
+            slice(None, i - 1, -2),
+            slice(j - 1, i - 1, -1),
+            slice(j - 1, i - 1, -2),
+        )
+    return slices
 
 
 @singledispatch
@@ -135,7 +181,12 @@ def stringify_keys(o: object) -> Any:
 
 @stringify_keys.register(abc.Mapping)
 def _stringify_keys_mapping(d: Mapping[int, int]) -> Mapping[str, int]:
-    return {str(k): v for k, v in d.items()}
+    return {_stringify_key(k): v for k, v in d.items()}
+
+
+@lru_cache(maxsize=512, typed=True)
+def _stringify_key(k: int) -> str:
+    return sys.intern(str(k))
 
 
 @stringify_keys.register(abc.Iterable)
@@ -9,6 +9,7 @@ from tiledb.segy.structured import Index, LabelIndexer, StructuredSegy
 
 from .conftest import (
     assert_equal_arrays,
+    collect,
     iter_slices,
     parametrize_segys,
     stringify_keys,
@@ -26,7 +27,7 @@ int_types = (
     np.uint16,
     np.uint8,
 )
-collect = segyio.tools.collect
+rng = np.random.default_rng(0xDEADBEEF)
 
 
 class TestLabelIndexer:
@@ -128,8 +129,8 @@ class TestStructuredSegy:
         t_line, s_line = getattr(t, line), getattr(s, line)
         assert len(t_line) == len(s_line)
 
-        i, j = np.sort(np.random.choice(getattr(s, lines), 2, replace=False))
-        x = np.random.choice(s.offsets)
+        i, j = np.sort(rng.choice(getattr(s, lines), 2, replace=False))
+        x = rng.choice(s.offsets)
 
         # one line, first offset
         assert_equal_arrays(t_line[i], s_line[i])
@@ -152,7 +153,7 @@ class TestStructuredSegy:
         s: SegyFile,
     ) -> None:
         t_line, s_line = getattr(t, line), getattr(s, line)
-        i, j = np.sort(np.random.choice(getattr(s, lines), 2, replace=False))
+        i, j = np.sort(rng.choice(getattr(s, lines), 2, replace=False))
         for sl2 in iter_slices(s.offsets[1], s.offsets[3]):
             # one line, slice offsets
             assert_equal_arrays(t_line[i, sl2], collect(s_line[i, sl2]))
@@ -177,8 +178,8 @@ class TestStructuredSegy:
         assert len(t_line) == len(s_line)
 
         lines = getattr(s, lines)
-        i = np.random.choice(lines)
-        x = np.random.choice(s.offsets)
+        i = rng.choice(lines)
+        x = rng.choice(s.offsets)
 
         # one line, first offset
         assert t_line[i] == stringify_keys(s_line[i])
@@ -202,7 +203,7 @@ class TestStructuredSegy:
     ) -> None:
         t_line, s_line = getattr(t.header, line), getattr(s.header, line)
         lines = getattr(s, lines)
-        i = np.random.choice(lines)
+        i = rng.choice(lines)
         o1, o2 = s.offsets[1], s.offsets[3]
         for sl2 in slice(None, o1), slice(o2, None), slice(o1, o2):
             # one line, slice offsets
@@ -219,9 +220,9 @@ class TestStructuredSegy:
     def test_depth_slice(self, t: StructuredSegy, s: SegyFile) -> None:
         # segyio doesn't currently support offset indexing for depth_slice
         # https://github.com/equinor/segyio/issues/474
-        i = np.random.randint(0, len(s.samples) // 2)
-        j = np.random.randint(i + 1, len(s.samples))
-        x = np.random.choice(s.offsets)
+        i = rng.integers(0, len(s.samples) // 2)
+        j = rng.integers(i + 1, len(s.samples))
+        x = rng.choice(s.offsets)
         for a in t, s:
             with pytest.raises(TypeError):
                 # one depth, x offset
@@ -235,8 +236,8 @@ class TestStructuredSegy:
     def test_depth_slice_many_offsets(self, t: StructuredSegy, s: SegyFile) -> None:
         # segyio doesn't currently support offset indexing for depth_slice
         # https://github.com/equinor/segyio/issues/474
-        i = np.random.randint(0, len(s.samples) // 2)
-        j = np.random.randint(i + 1, len(s.samples))
+        i = rng.integers(0, len(s.samples) // 2)
+        j = rng.integers(i + 1, len(s.samples))
         for sl2 in iter_slices(s.offsets[1], s.offsets[3]):
             for a in t, s:
                 with pytest.raises(TypeError):
@@ -249,13 +250,13 @@ class TestStructuredSegy:
 
     @parametrize_segys("t", "s", structured=True)
     def test_gather(self, t: StructuredSegy, s: SegyFile) -> None:
-        i = np.random.choice(s.ilines)
+        i = rng.choice(s.ilines)
         i_slices = [
             slice(None, s.ilines[2]),
             slice(s.ilines[-2], None),
             slice(i, i + 2),
         ]
-        x = np.random.choice(s.xlines)
+        x = rng.choice(s.xlines)
         x_slices = [
             slice(None, s.xlines[3]),
             slice(s.xlines[-3], None),
@@ -1,3 +1,7 @@
+import shutil
+from pathlib import Path
+from typing import Any
+
 import numpy as np
 import pytest
 import segyio.tools
@@ -9,12 +13,13 @@ from tiledb.segy import Segy
 
 from .conftest import (
     assert_equal_arrays,
+    collect,
     iter_slices,
     parametrize_segys,
     stringify_keys,
 )
 
-collect = segyio.tools.collect
+rng = np.random.default_rng(0xDEADBEEF)
 
 
 class TestSegy:
@@ -48,6 +53,30 @@ class TestSegy:
         with pytest.raises(TileDBError):
             t2.bin
 
+    @parametrize_segys("t", "s")
+    def test_open_missing_headers(
+        self,
+        t: Segy,
+        s: SegyFile,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        uri = tmp_path / t.uri.name
+        shutil.copytree(t.uri / "data", uri / "data")
+        opened = []
+
+        def open_array(*args: Any, **kwargs: Any) -> tiledb.Array:
+            array = tiledb_open(*args, **kwargs)
+            opened.append(array)
+            return array
+
+        tiledb_open = tiledb.open
+        monkeypatch.setattr(tiledb, "open", open_array)
+        with pytest.raises(TileDBError):
+            tiledb.segy.open(uri)
+        assert len(opened) == 1
+        assert not opened[0].isopen
+
     @parametrize_segys("t", "s")
     def test_repr(self, t: Segy, s: SegyFile) -> None:
         if s.unstructured:
@@ -59,10 +88,10 @@ class TestSegy:
     def test_trace(self, t: Segy, s: SegyFile) -> None:
         assert len(t.trace) == len(s.trace) == s.tracecount
 
-        i = np.random.randint(0, s.tracecount // 2)
-        j = np.random.randint(i + 1, s.tracecount)
-        x = np.random.randint(0, len(s.samples) // 2)
-        y = np.random.randint(x + 1, len(s.samples))
+        i = rng.integers(0, s.tracecount // 2)
+        j = rng.integers(i + 1, s.tracecount)
+        x = rng.integers(0, len(s.samples) // 2)
+        y = rng.integers(x + 1, len(s.samples))
 
         # one trace, all samples
         assert_equal_arrays(t.trace[i], s.trace[i])
@@ -93,8 +122,11 @@ class TestSegy:
     def test_header(self, t: Segy, s: SegyFile) -> None:
         assert len(t.header) == len(s.header)
 
-        i = np.random.randint(0, s.tracecount // 2)
+        i = rng.integers(0, s.tracecount // 2)
+        # empty selections do not depend on what has been cached
+        assert t.header[i:i] == t.header[i + 3 : i : 1] == []
         assert t.header[i] == stringify_keys(s.header[i])
+        assert t.header[i:i] == t.header[i + 3 : i : 1] == []
 
         slices = [
             slice(None, 3),
@@ -107,8 +139,41 @@ class TestSegy:
         for sl in slices:
             assert t.header[sl] == stringify_keys(s.header[sl])
 
+        records = t.header.as_array(slice(i, i + 3))
+        keys = records.dtype.names
+        rows = [dict(zip(keys, row)) for row in records.tolist()]
+        assert rows == stringify_keys(s.header[i : i + 3])
+        assert t.header.as_array(i).tolist() == records[:1].tolist()
+        last = t.header.as_array(slice(-1, None)).tolist()
+        assert t.header.as_array(-1).tolist() == last
+        assert (
+            t.header.as_array(-len(t.header)).tolist() == t.header.as_array(0).tolist()
+        )
+        for k in len(t.header), -len(t.header) - 1:
+            with pytest.raises(IndexError):
+                t.header.as_array(k)
+
+        indices = [i + 3, i, -1, i]
+        s_headers = [s.header[k] for k in indices]
+        assert t.header[indices] == stringify_keys(s_headers)
+        assert t.header[np.array(indices)] == stringify_keys(s_headers)
+        assert t.header[[]] == t.header[np.array([], dtype=int)] == []
+
         with pytest.raises(TypeError):
             t.header[i, 0]
+        with pytest.raises(TypeError):
+            t.header[np.array(i)]
+
+    @parametrize_segys("t", "s")
+    def test_header_uncached(
+        self, t: Segy, s: SegyFile, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(t.header, "max_cached_traces", 0)
+        i = rng.integers(0, s.tracecount // 2)
+        assert t.header[i] == stringify_keys(s.header[i])
+        assert t.header[i : i + 3] == stringify_keys(s.header[i : i + 3])
+        assert t.header[i + 3 : i : -1] == stringify_keys(s.header[i + 3 : i : -1])
+        assert t.header[i:i] == t.header[[]] == []
 
     @parametrize_segys("t", "s")
     def test_attributes(self, t: Segy, s: SegyFile) -> None:
@@ -116,22 +181,35 @@ class TestSegy:
         t_attrs = t.attributes(str_attr)
         s_attrs = s.attributes(getattr(TraceField, str_attr))
         assert len(t_attrs) == len(s_attrs)
+        assert t.attributes(str_attr) is t_attrs
 
-        i = np.random.randint(0, s.tracecount // 2)
-        j = np.random.randint(i + 1, s.tracecount)
+        i = rng.integers(0, s.tracecount // 2)
+        j = rng.integers(i + 1, s.tracecount)
         assert_equal_arrays(t_attrs[i], s_attrs[i])
+        assert_equal_arrays(t_attrs[-1], s_attrs[s.tracecount - 1])
+        with pytest.raises(IndexError):
+            t_attrs[s.tracecount]
         for sl in iter_slices(i, j):
             assert_equal_arrays(t_attrs[sl], s_attrs[sl])
 
+        indices = [j, i, -1, j]
+        s_values = np.concatenate([s_attrs[k % s.tracecount] for k in indices])
+        assert_equal_arrays(t_attrs[indices], s_values)
+        assert_equal_arrays(t_attrs[np.array(indices)], s_values)
+        assert_equal_arrays(t_attrs[[]], s_attrs[[]])
+        assert_equal_arrays(t_attrs[np.array([], dtype=int)], s_attrs[[]])
+
         with pytest.raises(TypeError):
             t_attrs[i, 0]
+        with pytest.raises(TypeError):
+            t_attrs[np.array(i)]
 
     @parametrize_segys("t", "s")
     def test_depth_slice(self, t: Segy, s: SegyFile) -> None:
         assert len(t.depth_slice) == len(s.depth_slice)
 
-        i = np.random.randint(0, len(s.samples) // 2)
-        j = np.random.randint(i + 1, len(s.samples))
+        i = rng.integers(0, len(s.samples) // 2)
+        j = rng.integers(i + 1, len(s.samples))
         # one depth
         assert_equal_arrays(t.depth_slice[i], s.depth_slice[i])
         # slice depths
@@ -1,5 +1,6 @@
 __all__ = ["open", "Segy", "StructuredSegy"]
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import PurePath
 from typing import Optional, Union
 
@@ -24,8 +25,23 @@ def open2(
     data_uri: URI, headers_uri: URI, config: Optional[tiledb.Config] = None
 ) -> Segy:
     ctx = tiledb.Ctx(config)
-    data = tiledb.open(str(data_uri), attr="trace", ctx=ctx)
-    headers = tiledb.open(str(headers_uri), ctx=ctx)
+    # open both arrays concurrently so that their (possibly remote) metadata
+    # requests overlap
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        data_future = executor.submit(tiledb.open, str(data_uri), attr="trace", ctx=ctx)
+        headers_future = executor.submit(tiledb.open, str(headers_uri), ctx=ctx)
+    # if either array failed to open, close the other one before re-raising
+    try:
+        data = data_future.result()
+    except Exception:
+        if headers_future.exception() is None:
+            headers_future.result().close()
+        raise
+    try:
+        headers = headers_future.result()
+    except Exception:
+        data.close()
+        raise
     if data.schema.domain.has_dim("traces"):
         cls = Segy
     else:
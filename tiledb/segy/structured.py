@@ -1,4 +1,3 @@
-import itertools as it
 from typing import List, Tuple, Union, cast
 
 import numpy as np
@@ -6,68 +5,84 @@ from segyio import TraceSortingFormat
 
 import tiledb
 
-from .singledispatchmethod import singledispatchmethod  # type: ignore
-from .types import Ellipsis, Index, NestedFieldList, cached_property, ellipsis
+from .types import Ellipsis, Index, Indices, NestedFieldList, cached_property, ellipsis
 from .unstructured import Header, Segy, TraceIndexer
 
 
 class StructuredTraceIndexer(TraceIndexer):
-    @singledispatchmethod
-    def __getitem__(self, i: object) -> None:
+    def __getitem__(
+        self, i: Indices
+    ) -> Tuple[Tuple[Indices, ...], Union[List[int], ellipsis]]:
+        if isinstance(i, (int, np.integer)):
+            return self._get_one(i)
+        if isinstance(i, (slice, list, np.ndarray)):
+            return self._get_many(i)
         raise TypeError(f"Cannot index by {i.__class__}")
 
-    @__getitem__.register(int)
-    @__getitem__.register(np.integer)
     def _get_one(self, trace_index: int) -> Tuple[Tuple[int, ...], ellipsis]:
         return np.unravel_index(trace_index, self._shape), Ellipsis
 
-    @__getitem__.register(slice)
-    def _get_many(self, trace_index: slice) -> Tuple[Tuple[List[int], ...], List[int]]:
+    def _get_many(
+        self, trace_index: Indices
+    ) -> Tuple[Tuple[List[int], ...], List[int]]:
         # get indices in 1D (trace index) and 3D (fast-slow-offset indices)
         raveled_indices = np.arange(len(self))[trace_index]
+        if not raveled_indices.size:
+            # TileDB cannot read an empty subarray: read the first trace instead
+            # and select nothing from it
+            return tuple([0] for _ in self._shape), []
         unraveled_indices = np.unravel_index(raveled_indices, self._shape)
         unique_unraveled_indices = tuple(map(np.unique, unraveled_indices))
-        if (trace_index.step or 1) < 0:
+
+        # find the position of each requested point in the bounding box
+        bbox_positions = [
+            unique.searchsorted(indices)
+            for unique, indices in zip(unique_unraveled_indices, unraveled_indices)
+        ]
+        if isinstance(trace_index, slice) and (trace_index.step or 1) < 0:
             unique_unraveled_indices = tuple(map(np.flip, unique_unraveled_indices))
+            bbox_positions = [
+                len(unique) - 1 - positions
+                for unique, positions in zip(unique_unraveled_indices, bbox_positions)
+            ]
         bounding_box = cast(
             Tuple[List[int]], tuple(map(list, unique_unraveled_indices))
         )
 
         # find the requested subset of indices from the cartesian product
-        points = frozenset(zip(*unraveled_indices))
-        post_reshape_indices = [
-            i
-            for i, point in enumerate(it.product(*unique_unraveled_indices))
-            if point in points
-        ]
-        return bounding_box, post_reshape_indices
+        bbox_shape = tuple(map(len, unique_unraveled_indices))
+        post_reshape_indices = np.ravel_multi_index(bbox_positions, bbox_shape)
+        return bounding_box, post_reshape_indices.tolist()
 
 
 class LabelIndexer:
     def __init__(self, labels: np.ndarray):
         if not issubclass(labels.dtype.type, np.integer):
             raise ValueError("labels should be integers")
-        if len(np.unique(labels)) != len(labels):
+        sorter = labels.argsort()
+        sorted_labels = labels[sorter]
+        if (sorted_labels[1:] == sorted_labels[:-1]).any():
             raise ValueError(f"labels should not contain duplicates: {labels}")
-        self._labels = labels
-        self._min_label = int(labels.min())
-        self._max_label = int(labels.max() + 1)
-        self._sorter = labels.argsort()
-
-    @singledispatchmethod
-    def __getitem__(self, i: object) -> None:
+        self.labels = labels
+        self._sorted_labels = sorted_labels
+        self._min_label = int(sorted_labels[0])
+        self._max_label = int(sorted_labels[-1]) + 1
+        self._sorter = sorter
+
+    def __getitem__(self, i: Union[int, np.integer, slice]) -> Union[int, List[int]]:
+        if isinstance(i, (int, np.integer)):
+            return self._get_one(i)
+        if isinstance(i, slice):
+            return self._get_many(i)
         raise TypeError(f"Cannot index by {i.__class__}")
 
-    @__getitem__.register(int)
-    @__getitem__.register(np.integer)
-    def _get_one(self, label: int) -> int:
-        indices = np.flatnonzero(label == self._labels)
-        assert indices.size <= 1, indices
-        if indices.size == 0:
+    def _get_one(self, label: Union[int, np.integer]) -> int:
+        sorted_labels = self._sorted_labels
+        position = sorted_labels.searchsorted(label)
+        if position == len(sorted_labels) or sorted_labels[position] != label:
             raise ValueError(f"{label} is not in labels")
-        return int(indices[0])
+        return int(self._sorter[position])
 
-    @__getitem__.register(slice)
     def _get_many(self, label_slice: slice) -> List[int]:
         start, stop, step = label_slice.start, label_slice.stop, label_slice.step
         increasing = step is None or step > 0
@@ -77,25 +92,23 @@ class LabelIndexer:
             stop = self._min_label - 1
 
         label_range = np.arange(*slice(start, stop, step).indices(self._max_label))
-        indices = self._sorter[
-            self._labels.searchsorted(label_range, sorter=self._sorter)
-        ]
-        return list(indices[self._labels[indices] == label_range])
+        indices = self._sorter[self._sorted_labels.searchsorted(label_range)]
+        return list(indices[self.labels[indices] == label_range])
 
 
 class Line:
     def __init__(
         self,
         dim_name: str,
-        labels: np.ndarray,
-        offsets: np.ndarray,
+        label_indexer: LabelIndexer,
+        offset_indexer: LabelIndexer,
         tdb: tiledb.Array,
     ):
         self.name = dim_name
         self._tdb = tdb
-        self._label_indexer = LabelIndexer(labels)
-        self._offset_indexer = LabelIndexer(offsets)
-        self._default_offset = offsets[0]
+        self._label_indexer = label_indexer
+        self._offset_indexer = offset_indexer
+        self._default_offset = offset_indexer.labels[0]
 
     def __len__(self) -> int:
         return cast(int, self._tdb.shape[self._dims.index(self.name)])
@@ -111,9 +124,9 @@ class Line:
 
     _dims = property(lambda self: [dim.name for dim in self._tdb.schema.domain])
 
-    def _get_tdb_indices(self, labels: Index, offsets: Index) -> Tuple[Index, ...]:
+    def _get_tdb_indices(self, labels: Index, offsets: Index) -> Tuple[Indices, ...]:
         dims = self._dims
-        composite_index = [slice(None)] * self._tdb.ndim
+        composite_index: List[Indices] = [slice(None)] * self._tdb.ndim
         composite_index[dims.index(self.name)] = self._label_indexer[labels]
         composite_index[dims.index("offsets")] = self._offset_indexer[offsets]
         return tuple(composite_index)
@@ -166,15 +179,16 @@ class HeaderLine(Line):
 class Gather:
     def __init__(
         self,
-        ilines: np.ndarray,
-        xlines: np.ndarray,
-        offsets: np.ndarray,
+        iline_indexer: LabelIndexer,
+        xline_indexer: LabelIndexer,
+        offset_indexer: LabelIndexer,
         tdb: tiledb.Array,
     ):
         self._tdb = tdb
-        self._iline_indexer = LabelIndexer(ilines)
-        self._xline_indexer = LabelIndexer(xlines)
-        self._offset_indexer = LabelIndexer(offsets)
+        self._iline_indexer = iline_indexer
+        self._xline_indexer = xline_indexer
+        self._offset_indexer = offset_indexer
+        offsets = offset_indexer.labels
         self._default_offset = offsets[0] if len(offsets) == 1 else slice(None)
 
     def __getitem__(self, t: Tuple[Index, ...]) -> np.ndarray:
@@ -185,7 +199,7 @@ class Gather:
             offsets = self._default_offset
 
         dims = tuple(dim.name for dim in self._tdb.schema.domain)
-        composite_index = [None] * 3
+        composite_index: List[Indices] = [slice(None)] * 3
         composite_index[dims.index("ilines")] = self._iline_indexer[ilines]
         composite_index[dims.index("xlines")] = self._xline_indexer[xlines]
         composite_index[dims.index("offsets")] = self._offset_indexer[offsets]
@@ -206,11 +220,11 @@ class StructuredSegy(Segy):
 
     @cached_property
     def iline(self) -> Line:
-        return Line("ilines", self.ilines, self.offsets, self._data)
+        return Line("ilines", self._iline_indexer, self._offset_indexer, self._data)
 
     @cached_property
     def xline(self) -> Line:
-        return Line("xlines", self.xlines, self.offsets, self._data)
+        return Line("xlines", self._xline_indexer, self._offset_indexer, self._data)
 
     @cached_property
     def fast(self) -> Line:
@@ -228,7 +242,9 @@ class StructuredSegy(Segy):
 
     @cached_property
     def gather(self) -> Gather:
-        return Gather(self.ilines, self.xlines, self.offsets, self._data)
+        return Gather(
+            self._iline_indexer, self._xline_indexer, self._offset_indexer, self._data
+        )
 
     @cached_property
     def offsets(self) -> np.ndarray:
@@ -246,10 +262,23 @@ class StructuredSegy(Segy):
     def header(self) -> Header:
         header = super().header
         for attr, name in ("iline", "ilines"), ("xline", "xlines"):
-            line = HeaderLine(name, getattr(self, name), self.offsets, self._headers)
+            label_indexer = getattr(self, f"_{attr}_indexer")
+            line = HeaderLine(name, label_indexer, self._offset_indexer, self._headers)
             setattr(header, attr, line)
         return header
 
+    @cached_property
+    def _iline_indexer(self) -> LabelIndexer:
+        return LabelIndexer(self.ilines)
+
+    @cached_property
+    def _xline_indexer(self) -> LabelIndexer:
+        return LabelIndexer(self.xlines)
+
+    @cached_property
+    def _offset_indexer(self) -> LabelIndexer:
+        return LabelIndexer(self.offsets)
+
     def cube(self) -> np.ndarray:
         if self.sorting == TraceSortingFormat.INLINE_SORTING:
             fast, slow = self.ilines, self.xlines
@@ -1,5 +1,7 @@
 from typing import TYPE_CHECKING, Dict, List, Union
 
+import numpy as np
+
 # https://github.com/python/typing/issues/684#issuecomment-548203158
 if TYPE_CHECKING:  # pragma: nocover
     from enum import Enum
@@ -15,5 +17,6 @@ else:
     cached_property = __import__("cached_property").cached_property
 
 Index = Union[int, slice]
+Indices = Union[Index, List[int], np.ndarray]
 Field = Dict[str, int]
 NestedFieldList = Union[List[Field], List[List[Field]], List[List[List[Field]]]]
@@ -1,20 +1,25 @@
 import os
 from pathlib import PurePath
 from types import TracebackType
-from typing import List, Optional, Tuple, Type, Union, cast
+from typing import Dict, List, Optional, Tuple, Type, Union, cast
 
 import numpy as np
 from segyio import TraceSortingFormat
 
 import tiledb
 
-from .singledispatchmethod import singledispatchmethod  # type: ignore
 from .tdbwrapper import MultiAttrArrayWrapper, SingleAttrArrayWrapper
-from .types import Ellipsis, Field, Index, cached_property, ellipsis
+from .types import Ellipsis, Field, Index, Indices, cached_property, ellipsis
 
 
-def ensure_slice(i: Index) -> slice:
-    return i if isinstance(i, slice) else slice(i, i + 1)
+def ensure_slice(i: Indices, length: int) -> Indices:
+    if isinstance(i, np.ndarray) and i.ndim != 1:
+        raise TypeError(f"Cannot index by {i.ndim}-dimensional array")
+    if isinstance(i, (slice, list, np.ndarray)):
+        return i
+    # normalize and bounds check an integer index before converting it to a slice
+    i = range(length)[i]
+    return slice(i, i + 1)
 
 
 class TraceIndexer:
@@ -25,16 +30,25 @@ class TraceIndexer:
         return int(np.asarray(self._shape).prod())
 
     def __getitem__(
-        self, trace_index: Index
-    ) -> Tuple[Tuple[Index, ...], Union[List[int], ellipsis]]:
+        self, trace_index: Indices
+    ) -> Tuple[Tuple[Indices, ...], Union[List[int], ellipsis]]:
         """
         Given a trace index, return a `(bounding_box, post_reshape_indices)` tuple where:
-        - `bounding_box` is a tuple of (int or slice) indices for each dimension in shape
-            that enclose all data of the requested `trace_index`.
+        - `bounding_box` is a tuple of (int, slice or list) indices for each dimension in
+            shape that enclose all data of the requested `trace_index`.
         - `post_reshape_indices` is a list of indices to select from the reshaped 1D
             bounding box in order to get the requested `trace_index` data. It may also
             be ellipsis (...) if the whole bounding box is to be selected.
         """
+        if isinstance(trace_index, (list, np.ndarray)):
+            # read each distinct trace once, in increasing order
+            raveled_indices = np.arange(len(self))[trace_index]
+            if not raveled_indices.size:
+                # TileDB cannot read an empty subarray: read the first trace instead
+                # and select nothing from it
+                return ([0],), []
+            unique_indices, inverse = np.unique(raveled_indices, return_inverse=True)
+            return (unique_indices.tolist(),), inverse.tolist()
         return (trace_index,), Ellipsis
 
 
@@ -55,7 +69,7 @@ class Trace(TraceIndexable):
             trace_index, samples = i, slice(None)
 
         bounding_box, post_reshape_indices = self._indexer[trace_index]
-        traces = self._tdb[(*bounding_box, ensure_slice(samples))]
+        traces = self._tdb[(*bounding_box, ensure_slice(samples, self._tdb.shape[-1]))]
 
         if not (isinstance(trace_index, slice) or isinstance(samples, slice)):
             # convert to scalar (https://github.com/equinor/segyio/issues/475)
@@ -67,27 +81,86 @@ class Trace(TraceIndexable):
 
 
 class Header(TraceIndexable):
-    @singledispatchmethod
-    def __getitem__(self, i: object) -> None:
+    # headers of up to this many traces are cached in memory as they are read
+    max_cached_traces = 100_000
+
+    def __init__(self, tdb: tiledb.Array, indexer: TraceIndexer):
+        super().__init__(tdb, indexer)
+        self._records: Optional[np.ndarray] = None
+        self._cached: Optional[np.ndarray] = None
+
+    def __getitem__(self, i: Indices) -> Union[Field, List[Field]]:
+        if isinstance(i, (int, np.integer)):
+            return self._get_one(i)
+        if isinstance(i, (slice, list, np.ndarray)):
+            return self._get_many(i)
         raise TypeError(f"Cannot index by {i.__class__}")
 
-    @__getitem__.register(int)
-    @__getitem__.register(np.integer)
-    def _get_one(self, i: int) -> Field:
-        return cast(Field, self[i : i + 1][0])
+    def _get_one(self, i: Union[int, np.integer]) -> Field:
+        # normalize and bounds check the index without building an index array
+        i = range(len(self))[i]
+        if self._records is not None and self._cached is not None and self._cached[i]:
+            record = self._records[i]
+        else:
+            records = self._read(slice(i, i + 1))
+            if len(self) <= self.max_cached_traces:
+                self._store(slice(i, i + 1), records)
+            record = records[0]
+        return dict(zip(record.dtype.names, record.item()))
+
+    def _get_many(self, i: Indices) -> List[Field]:
+        records = self.as_array(i)
+        keys = records.dtype.names
+        # convert all rows to tuples of Python scalars in a single call
+        return [dict(zip(keys, row)) for row in records.tolist()]
+
+    def as_array(self, i: Indices) -> np.ndarray:
+        """
+        Return the headers of the given trace(s) as a record array, with one field
+        per header name.
+        """
+        i = ensure_slice(i, len(self))
+        if isinstance(i, slice) and not range(len(self))[i]:
+            # TileDB cannot read an empty range: select an empty list of traces instead
+            i = []
+        if len(self) > self.max_cached_traces:
+            return self._read(i)
+
+        trace_indices = np.arange(len(self))[i]
+        if self._cached is not None:
+            uncached = trace_indices[~self._cached[trace_indices]]
+        else:
+            uncached = trace_indices
+        if uncached.size:
+            # read only the distinct uncached traces with a single multi-range query
+            uncached = np.unique(uncached)
+            self._store(uncached, self._read(uncached.tolist()))
+        elif self._records is None:
+            return self._read(i)
+        return cast(np.ndarray, self._records)[trace_indices]
+
+    def _store(
+        self, trace_indices: Union[slice, np.ndarray], records: np.ndarray
+    ) -> None:
+        if self._records is None or self._cached is None:
+            self._records = np.recarray(len(self), records.dtype)
+            self._cached = np.zeros(len(self), dtype=bool)
+        self._records[trace_indices] = records
+        self._cached[trace_indices] = True
 
-    @__getitem__.register(slice)
-    def _get_many(self, i: slice) -> List[Field]:
+    def _read(self, i: Indices) -> np.ndarray:
         bounding_box, post_reshape_indices = self._indexer[i]
         header_arrays = self._tdb[bounding_box]
-        keys = header_arrays.keys()
-        columns = [header_arrays[key].reshape(-1)[post_reshape_indices] for key in keys]
-        return [dict(zip(keys, row)) for row in zip(*columns)]
+        columns = [
+            array.reshape(-1)[post_reshape_indices] for array in header_arrays.values()
+        ]
+        records = np.rec.fromarrays(columns, names=list(header_arrays.keys()))
+        return cast(np.ndarray, records)
 
 
 class Attributes(TraceIndexable):
-    def __getitem__(self, i: Index) -> np.ndarray:
-        bounding_box, post_reshape_indices = self._indexer[ensure_slice(i)]
+    def __getitem__(self, i: Indices) -> np.ndarray:
+        bounding_box, post_reshape_indices = self._indexer[ensure_slice(i, len(self))]
         return self._tdb[bounding_box].reshape(-1)[post_reshape_indices]
 
 
@@ -98,8 +171,8 @@ class Depth:
     def __len__(self) -> int:
         return cast(int, self._tdb.shape[-1])
 
-    def __getitem__(self, i: Index) -> np.ndarray:
-        if not isinstance(i, (int, slice)):
+    def __getitem__(self, i: Union[int, np.integer, slice]) -> np.ndarray:
+        if not isinstance(i, (int, np.integer, slice)):
             raise TypeError(
                 f"depth indices must be integers or slices, not {i.__class__.__name__}"
             )
@@ -139,9 +212,7 @@ class Segy:
 
     @cached_property
     def bin(self) -> Field:
-        bin_headers = dict(self._headers.meta.items())
-        del bin_headers["__text__"]
-        return bin_headers
+        return {k: v for k, v in self._headers.meta.items() if k != "__text__"}
 
     @cached_property
     def text(self) -> Tuple[bytes, ...]:
@@ -164,10 +235,17 @@ class Segy:
         return Header(self._headers, self._indexer_cls(self._headers.shape))
 
     def attributes(self, name: str) -> Attributes:
-        return Attributes(
-            SingleAttrArrayWrapper(self._headers.__wrapped__, attr=name),
-            self._indexer_cls(self._headers.shape),
-        )
+        attributes = self._attributes.get(name)
+        if attributes is None:
+            attributes = self._attributes[name] = Attributes(
+                SingleAttrArrayWrapper(self._headers.__wrapped__, attr=name),
+                self._indexer_cls(self._headers.shape),
+            )
+        return attributes
+
+    @cached_property
+    def _attributes(self) -> Dict[str, Attributes]:
+        return {}
 
     @cached_property
     def depth_slice(self) -> Depth:
@@ -201,4 +279,6 @@ class Segy:
         values = self._data.meta[meta_key]
         if not isinstance(values, tuple):
             values = (values,)
-        return np.array(values, dtype)
+        if dtype is None:
+            dtype = np.dtype(type(values[0]))
+        return np.fromiter(values, dtype, count=len(values))